@@ -4,18 +4,48 @@ __author__ = "Lukas Heumos"
 __email__ = "lukas.heumos@posteo.net"
 __version__ = "0.8.0"
 
-import warnings
+from importlib import import_module
 
-from matplotlib import MatplotlibDeprecationWarning
-from numba import NumbaDeprecationWarning
+# The namespaces pull in heavy dependencies such as scvi-tools and jax, so they are
+# imported lazily on first attribute access instead of at `import pertpy` time.
+_submodules = {
+    "dt": "pertpy.data",
+    "md": "pertpy.metadata",
+    "pl": "pertpy.plot",
+    "pp": "pertpy.preprocessing",
+    "tl": "pertpy.tools",
+}
 
-warnings.filterwarnings("ignore", category=NumbaDeprecationWarning)
-warnings.filterwarnings("ignore", category=MatplotlibDeprecationWarning)
-warnings.filterwarnings("ignore", category=SyntaxWarning)
-warnings.filterwarnings("ignore", category=UserWarning, module="scvi._settings")
+__all__ = ["dt", "md", "pl", "pp", "tl"]
 
-from . import data as dt
-from . import metadata as md
-from . import plot as pl
-from . import preprocessing as pp
-from . import tools as tl
+_warnings_configured = False
+
+
+def _configure_warnings() -> None:
+    """Silence known-noisy dependency warnings before the heavy imports emit them."""
+    global _warnings_configured
+    if _warnings_configured:
+        return
+    import warnings
+
+    from matplotlib import MatplotlibDeprecationWarning
+    from numba import NumbaDeprecationWarning
+
+    warnings.filterwarnings("ignore", category=NumbaDeprecationWarning)
+    warnings.filterwarnings("ignore", category=MatplotlibDeprecationWarning)
+    warnings.filterwarnings("ignore", category=SyntaxWarning)
+    warnings.filterwarnings("ignore", category=UserWarning, module="scvi._settings")
+    _warnings_configured = True
+
+
+def __getattr__(name: str):
+    if name in _submodules:
+        _configure_warnings()
+        module = import_module(_submodules[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_submodules))
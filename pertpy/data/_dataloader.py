@@ -14,7 +14,7 @@ def _download(  # pragma: no cover
     url: str,
     output_file_name: str = None,
     output_path: str | Path = None,
-    block_size: int = 1024,
+    block_size: int = 1 << 20,
     overwrite: bool = False,
     is_zip: bool = False,
 ) -> None:
@@ -24,7 +24,7 @@ def _download(  # pragma: no cover
         url: URL to download
         output_file_name: Name of the downloaded file
         output_path: Path to download/extract the files to (default: OS tmpdir)
-        block_size: Block size for downloads in bytes (default: 1024)
+        block_size: Block size for downloads in bytes (default: 1 MiB)
         overwrite: Whether to overwrite existing files (default: False)
         is_zip: Whether the downloaded file needs to be unzipped (default: False)
     """
@@ -56,7 +56,7 @@ def _download(  # pragma: no cover
             with Path(temp_file_name).open("wb") as file:
                 for data in response.iter_content(block_size):
                     file.write(data)
-                    progress.update(task, advance=block_size)
+                    progress.update(task, advance=len(data))
             progress.update(task, completed=total, refresh=True)
 
         Path(temp_file_name).replace(download_to_path)
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Literal
 from lamin_utils import logger
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -47,7 +47,6 @@ class CellLine(MetaData):
                     url="https://ndownloader.figshare.com/files/43746708",
                     output_file_name="depmap_23Q4_info.csv",
                     output_path=settings.cachedir,
-                    block_size=4096,
                     is_zip=False,
                 )
             self.depmap = pd.read_csv(depmap_cell_line_path)
@@ -70,7 +69,6 @@ class CellLine(MetaData):
                         "bSortable_2=true&bSortable_3=true&bSortable_4=true&bSortable_5=true&bSortable_6=true&export=csv",
                         output_file_name="cell_line_cancer_project.csv",
                         output_path=settings.cachedir,
-                        block_size=4096,
                         is_zip=False,
                     )
                 self.cancerxgene = pd.read_csv(cancerxgene_cell_line_path)
@@ -102,7 +100,6 @@ class CellLine(MetaData):
                 url="https://cog.sanger.ac.uk/cmp/download/gene_identifiers_20191101.csv",
                 output_file_name="genes_info.csv",
                 output_path=settings.cachedir,
-                block_size=4096,
                 is_zip=False,
             )
         self.gene_annotation = pd.read_table(gene_annotation_file_path, delimiter=",")
@@ -119,7 +116,6 @@ class CellLine(MetaData):
                     url="https://figshare.com/ndownloader/files/42467103",
                     output_file_name="rnaseq_sanger_info.csv",
                     output_path=settings.cachedir,
-                    block_size=4096,
                     is_zip=False,
                 )
             self.bulk_rna_sanger = pd.read_csv(bulk_rna_sanger_file_path, index_col=0, dtype="unicode")
@@ -132,7 +128,6 @@ class CellLine(MetaData):
                     url="https://figshare.com/ndownloader/files/34989922",
                     output_file_name="rnaseq_depmap_info.csv",
                     output_path=settings.cachedir,
-                    block_size=4096,
                     is_zip=False,
                 )
             self.bulk_rna_broad = pd.read_csv(bulk_rna_broad_file_path, index_col=0)
@@ -146,7 +141,6 @@ class CellLine(MetaData):
                 url="https://figshare.com/ndownloader/files/42468393",
                 output_file_name="proteomics_info.csv",
                 output_path=settings.cachedir,
-                block_size=4096,
                 is_zip=False,
             )
         self.proteomics = pd.read_csv(proteomics_file_path, index_col=0)
@@ -162,7 +156,6 @@ class CellLine(MetaData):
                     url="https://figshare.com/ndownloader/files/43757235",
                     output_file_name="gdsc1_info.csv",
                     output_path=settings.cachedir,
-                    block_size=4096,
                     is_zip=False,
                 )
             self.drug_response_gdsc1 = pd.read_csv(drug_response_gdsc1_file_path, index_col=0)
@@ -173,7 +166,6 @@ class CellLine(MetaData):
                     url="https://figshare.com/ndownloader/files/43757232",
                     output_file_name="gdsc2_info.csv",
                     output_path=settings.cachedir,
-                    block_size=4096,
                     is_zip=False,
                 )
             self.drug_response_gdsc2 = pd.read_csv(drug_response_gdsc2_file_path, index_col=0)
@@ -575,36 +567,28 @@ class CellLine(MetaData):
             >>> pt_metadata = pt.md.CellLine()
             >>> lookup = pt_metadata.lookup()
         """
-        # Fetch the metadata if it hasn't beed downloaded yet
-        if self.depmap is None:
-            self._download_cell_line(cell_line_source="DepMap")
-        if self.cancerxgene is None:
-            self._download_cell_line(cell_line_source="Cancerrxgene")
-        if self.gene_annotation is None:
-            self._download_gene_annotation()
-        if self.bulk_rna_broad is None:
-            self._download_bulk_rna(cell_line_source="broad")
-        if self.bulk_rna_sanger is None:
-            self._download_bulk_rna(cell_line_source="sanger")
-        if self.proteomics is None:
-            self._download_proteomics()
-        if self.drug_response_gdsc1 is None:
-            self._download_gdsc(gdsc_dataset=1)
-        if self.drug_response_gdsc2 is None:
-            self._download_gdsc(gdsc_dataset=2)
 
-        # Transfer the data
+        # Hand the LookUp object loaders instead of materialized DataFrames so that
+        # each dataset is only downloaded once a lookup method actually needs it.
+        def lazy(attribute: str, download: Callable[[], None]) -> Callable[[], pd.DataFrame]:
+            def load() -> pd.DataFrame:
+                if getattr(self, attribute) is None:
+                    download()
+                return getattr(self, attribute)
+
+            return load
+
         return LookUp(
             type="cell_line",
             transfer_metadata=[
-                self.depmap,
-                self.cancerxgene,
-                self.gene_annotation,
-                self.bulk_rna_sanger,
-                self.bulk_rna_broad,
-                self.proteomics,
-                self.drug_response_gdsc1,
-                self.drug_response_gdsc2,
+                lazy("depmap", lambda: self._download_cell_line(cell_line_source="DepMap")),
+                lazy("cancerxgene", lambda: self._download_cell_line(cell_line_source="Cancerrxgene")),
+                lazy("gene_annotation", self._download_gene_annotation),
+                lazy("bulk_rna_sanger", lambda: self._download_bulk_rna(cell_line_source="sanger")),
+                lazy("bulk_rna_broad", lambda: self._download_bulk_rna(cell_line_source="broad")),
+                lazy("proteomics", self._download_proteomics),
+                lazy("drug_response_gdsc1", lambda: self._download_gdsc(gdsc_dataset=1)),
+                lazy("drug_response_gdsc2", lambda: self._download_gdsc(gdsc_dataset=2)),
             ],
         )
 
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 import pandas as pd
 import pubchempy as pcp
+from scanpy import settings
 
 from ._look_up import LookUp
 from ._metadata import MetaData
@@ -17,6 +21,24 @@ class Compound(MetaData):
 
     def __init__(self):
         super().__init__()
+        self._pubchem_cache: sqlite3.Connection | None = None
+
+    def _get_pubchem_cache(self) -> sqlite3.Connection:
+        """Open the on-disk cache of PubChem query results, creating it if needed."""
+        if self._pubchem_cache is None:
+            Path(settings.cachedir).mkdir(parents=True, exist_ok=True)
+            self._pubchem_cache = sqlite3.connect(Path(settings.cachedir) / "pubchem_cache.db")
+            self._pubchem_cache.execute(
+                "CREATE TABLE IF NOT EXISTS compounds"
+                "(kind TEXT, id TEXT, name TEXT, cid INTEGER, smiles TEXT, PRIMARY KEY (kind, id))"
+            )
+        return self._pubchem_cache
+
+    def clear_cache(self) -> None:
+        """Delete all locally cached PubChem query results."""
+        cache = self._get_pubchem_cache()
+        cache.execute("DELETE FROM compounds")
+        cache.commit()
 
     def annotate_compounds(
         self,
@@ -24,6 +46,7 @@ class Compound(MetaData):
         query_id: str = "perturbation",
         query_id_type: Literal["name", "cid"] = "name",
         verbosity: int | str = 5,
+        categorical: bool = True,
         copy: bool = False,
     ) -> AnnData:
         """Fetch compound annotation from pubchempy.
@@ -33,6 +56,8 @@ class Compound(MetaData):
             query_id: The column of `.obs` with compound identifiers.
             query_id_type: The type of compound identifiers, 'name' or 'cid'.
             verbosity: The number of unmatched identifiers to print, can be either non-negative values or "all".
+            categorical: Determines whether the annotated metadata columns are converted to category dtype.
+                         The annotations repeat per compound, so this saves considerable memory on large datasets.
             copy: Determines whether a copy of the `adata` is returned.
 
         Returns:
@@ -46,71 +71,120 @@ class Compound(MetaData):
 
         query_dict = {}
         not_matched_identifiers = []
-        for compound in adata.obs[query_id].dropna().astype(str).unique():
+        unique_ids = adata.obs[query_id].dropna().astype(str).unique()
+
+        # Nothing to look up when the query column has no non-null values; skip the
+        # network round-trips and attach typed all-NA columns via the join below.
+        if len(unique_ids) > 0:
+            # Serve identifiers that were queried in an earlier run from the on-disk cache
+            # so that repeat annotations do no network I/O for them.
+            cache = self._get_pubchem_cache()
+            for chunk_start in range(0, len(unique_ids), 500):
+                chunk = unique_ids[chunk_start : chunk_start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = cache.execute(
+                    f"SELECT id, name, cid, smiles FROM compounds WHERE kind = ? AND id IN ({placeholders})",
+                    (query_id_type, *chunk),
+                )
+                for identifier, name, cid, smiles in rows:
+                    query_dict[identifier] = [name, cid, smiles]
+            missing_ids = [identifier for identifier in unique_ids if identifier not in query_dict]
+
             if query_id_type == "name":
-                cids = pcp.get_compounds(compound, "name")
-                if len(cids) == 0:  # search did not work
-                    not_matched_identifiers.append(compound)
-                if len(cids) >= 1:
+                # PubChem's name endpoint only accepts a single name per request, so the
+                # lookups are latency-bound; overlap them with a small thread pool.
+                # The worker count is kept modest to stay within PubChem's request policy.
+                def _lookup_name(compound: str) -> tuple[str, list | None]:
+                    cids = pcp.get_compounds(compound, "name")
+                    if len(cids) == 0:  # search did not work
+                        return compound, None
                     # If the name matches the first synonym offered by PubChem (outside of capitalization),
                     # it is not changed (outside of capitalization). Otherwise, it is replaced with the first synonym.
-                    query_dict[compound] = [
+                    return compound, [
                         cids[0].synonyms[0],
                         cids[0].cid,
                         cids[0].canonical_smiles,
                     ]
+
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    for compound, result in executor.map(_lookup_name, missing_ids):
+                        if result is None:
+                            not_matched_identifiers.append(compound)
+                        else:
+                            query_dict[compound] = result
             else:
-                try:
-                    cid = pcp.Compound.from_cid(compound)
-                    query_dict[compound] = [
-                        cid.synonyms[0],
-                        compound,
-                        cid.canonical_smiles,
-                    ]
-                except pcp.BadRequestError:
-                    # pubchempy throws badrequest if a cid is not found
-                    not_matched_identifiers.append(compound)
-
-        identifier_num_all = len(adata.obs[query_id].unique())
-        self._warn_unmatch(
-            total_identifiers=identifier_num_all,
-            unmatched_identifiers=not_matched_identifiers,
-            query_id=query_id,
-            reference_id=query_id_type,
-            metadata_type="compound",
-            verbosity=verbosity,
-        )
+                # PubChem's PUG-REST accepts lists of CIDs, so fetch chunks of identifiers
+                # with a single request each instead of one round-trip per identifier.
+                chunk_size = 100
+                for chunk_start in range(0, len(missing_ids), chunk_size):
+                    chunk = missing_ids[chunk_start : chunk_start + chunk_size]
+                    try:
+                        cids = pcp.get_compounds([int(compound) for compound in chunk], "cid")
+                        matched = {str(cid.cid): cid for cid in cids}
+                    except (pcp.BadRequestError, ValueError):
+                        # A single malformed identifier fails the whole batch; retry one by one.
+                        matched = None
+                    for compound in chunk:
+                        if matched is not None:
+                            cid = matched.get(str(int(compound)))
+                        else:
+                            try:
+                                cid = pcp.Compound.from_cid(compound)
+                            except pcp.BadRequestError:
+                                # pubchempy throws badrequest if a cid is not found
+                                cid = None
+                        if cid is None:
+                            not_matched_identifiers.append(compound)
+                        else:
+                            query_dict[compound] = [
+                                cid.synonyms[0],
+                                compound,
+                                cid.canonical_smiles,
+                            ]
+
+            new_rows = [
+                (query_id_type, identifier, *query_dict[identifier])
+                for identifier in missing_ids
+                if identifier in query_dict
+            ]
+            if new_rows:
+                cache.executemany("INSERT OR REPLACE INTO compounds VALUES (?, ?, ?, ?, ?)", new_rows)
+                cache.commit()
+
+            identifier_num_all = len(unique_ids)
+            self._warn_unmatch(
+                total_identifiers=identifier_num_all,
+                unmatched_identifiers=not_matched_identifiers,
+                query_id=query_id,
+                reference_id=query_id_type,
+                metadata_type="compound",
+                verbosity=verbosity,
+            )
 
-        query_df = pd.DataFrame.from_dict(query_dict, orient="index", columns=["pubchem_name", "pubchem_ID", "smiles"])
-        # Merge and remove duplicate columns
-        # Column is converted to float after merging due to unmatches
-        # Convert back to integers
+        # Build the lookup frame column-wise with nullable dtypes so that unmatched
+        # rows stay NA after the merge instead of casting pubchem_ID to float.
+        query_df = pd.DataFrame(
+            {
+                "pubchem_name": pd.array([name for name, _, _ in query_dict.values()], dtype="string"),
+                "pubchem_ID": pd.array([int(cid) for _, cid, _ in query_dict.values()], dtype="Int64"),
+                "smiles": pd.array([smiles for _, _, smiles in query_dict.values()], dtype="string"),
+            },
+            index=pd.Index(query_dict.keys()),
+        )
+        # query_df is indexed by the queried name; index it by CID in the cid case so
+        # that both paths take join's indexed fast path instead of merge's hash build.
+        # The CID column would only duplicate the query column in that case, so it is
+        # folded into the index rather than kept.
         if query_id_type == "cid":
-            query_df.pubchem_ID = query_df.pubchem_ID.astype("Int64")
-            adata.obs = (
-                adata.obs.merge(
-                    query_df,
-                    left_on=query_id,
-                    right_on="pubchem_ID",
-                    how="left",
-                    suffixes=("", "_fromMeta"),
-                )
-                .filter(regex="^(?!.*_fromMeta)")
-                .set_index(adata.obs.index)
-            )
-        else:
-            adata.obs = (
-                adata.obs.merge(
-                    query_df,
-                    left_on=query_id,
-                    right_index=True,
-                    how="left",
-                    suffixes=("", "_fromMeta"),
-                )
-                .filter(regex="^(?!.*_fromMeta)")
-                .set_index(adata.obs.index)
-            )
-            adata.obs.pubchem_ID = adata.obs.pubchem_ID.astype("Int64")
+            query_df = query_df.set_index("pubchem_ID")
+        adata.obs = adata.obs.join(query_df, on=query_id, how="left", rsuffix="_fromMeta").filter(
+            regex="^(?!.*_fromMeta)"
+        )
+
+        if categorical:
+            for column in ("pubchem_name", "smiles"):
+                if column in adata.obs:
+                    adata.obs[column] = adata.obs[column].astype("category")
 
         return adata
 
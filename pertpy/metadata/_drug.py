@@ -28,7 +28,6 @@ def _download_drug_annotation(
                 url="https://figshare.com/ndownloader/files/43871718",
                 output_file_name="chembl.json",
                 output_path=settings.cachedir,
-                block_size=4096,
                 is_zip=False,
             )
         with chembl_path.open() as file:
@@ -42,7 +41,6 @@ def _download_drug_annotation(
                 url="https://www.dgidb.org/data/latest/interactions.tsv",
                 output_file_name="dgidb.tsv",
                 output_path=settings.cachedir,
-                block_size=4096,
                 is_zip=False,
             )
         dgidb_df = pd.read_table(dgidb_path)
@@ -55,7 +53,6 @@ def _download_drug_annotation(
                 url="https://api.pharmgkb.org/v1/download/file/data/relationships.zip",
                 output_file_name="pharmgkb.zip",
                 output_path=settings.cachedir,
-                block_size=4096,
                 is_zip=True,
             )
             Path.rename(Path(settings.cachedir) / "relationships.tsv", pharmgkb_path)
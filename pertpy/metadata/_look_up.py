@@ -3,10 +3,11 @@ from __future__ import annotations
 from collections import namedtuple
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
 from lamin_utils import logger
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -17,6 +18,23 @@ import pubchempy as pcp
 class LookUp:
     """Generate LookUp object for different type of metadata."""
 
+    # Attribute names the positional transfer_metadata DataFrames are bound to, per metadata type.
+    _transfer_attributes = {
+        "cell_line": (
+            "cell_line_meta",
+            "cl_cancer_project_meta",
+            "gene_annotation",
+            "bulk_rna_sanger",
+            "bulk_rna_broad",
+            "proteomics_data",
+            "drug_response_gdsc1",
+            "drug_response_gdsc2",
+        ),
+        "moa": ("moa_meta",),
+        "compound": (),
+        "drug": ("chembl", "dgidb", "pharmgkb"),
+    }
+
     def __init__(
         self,
         type: Literal["cell_line", "moa", "compound", "drug"] = "cell_line",
@@ -25,171 +43,23 @@ class LookUp:
         """
         Args:
             type: Metadata type for annotation. One of 'cell_line', 'compound', 'moa' or 'drug.
-            transfer_metadata: DataFrames used to generate Lookup object.
+            transfer_metadata: DataFrames used to generate Lookup object, or zero-argument
+                               callables returning them. Callables are only invoked when the
+                               corresponding metadata is first accessed, so unused DataFrames
+                               are never downloaded or loaded into memory.
                                This is currently set to None for CompoundMetaData which does not require any dataframes for transfer.
         """
         self.type = type
-        if type == "cell_line":
-            self.cell_line_meta = transfer_metadata[0]
-            self.cl_cancer_project_meta = transfer_metadata[1]
-            self.gene_annotation = transfer_metadata[2]
-            self.bulk_rna_sanger = transfer_metadata[3]
-            self.bulk_rna_broad = transfer_metadata[4]
-            self.proteomics_data = transfer_metadata[5]
-            self.drug_response_gdsc1 = transfer_metadata[6]
-            self.drug_response_gdsc2 = transfer_metadata[7]
-
-            cell_line_annotation = namedtuple(
-                "cell_line_annotation",
-                "n_cell_line cell_line n_metadata metadata reference_id reference_id_example default_parameter",
-            )
-            cell_lines = namedtuple("cell_lines", ["depmap", "cancerrxgene"])
-
-            depmap_data = {
-                "n_cell_line": len(self.cell_line_meta.index),
-                "n_metadata": len(self.cell_line_meta.columns),
-                "cell_line": self.cell_line_meta.ModelID.values,
-                "metadata": self.cell_line_meta.columns.values,
-                "reference_id": [
-                    "ModelID",
-                    "CellLineName",
-                    "StrippedCellLineName",
-                    "CCLE_Name",
-                ],
-                "reference_id_example": "ModelID: ACH-000001 | CellLineName: NIH:OVCAR-3 | StrippedCellLineName: NIHOVCAR3 | CCLEName: NIHOVCAR3_OVARY",
-                "default_parameter": {
-                    "cell_line_source": "DepMap",
-                    "query_id": "DepMap_ID",
-                    "reference_id": "ModelID",
-                    "fetch": "None",
-                },
-            }
-            depmap_record = cell_line_annotation(**depmap_data)
-
-            cancerrxgene_data = {
-                "n_cell_line": len(self.cl_cancer_project_meta.index),
-                "n_metadata": len(self.cl_cancer_project_meta.columns),
-                "cell_line": self.cl_cancer_project_meta.stripped_cell_line_name.values,
-                "metadata": self.cl_cancer_project_meta.columns.values,
-                "reference_id": [
-                    "cell_line_name",
-                    "stripped_cell_line_name",
-                    "Model ID",
-                    "COSMIC ID",
-                ],
-                "reference_id_example": "cell_line_name: SNU-283 | stripped_cell_line_name: SNU283 | Model ID: SIDM00215 | COSMIC ID: 1659929",
-                "default_parameter": {
-                    "query_id": "stripped_cell_line_name",
-                    "reference_id": "stripped_cell_line_name",
-                    "fetch": "None",
-                },
-            }
-            cancerrxgene_record = cell_line_annotation(**cancerrxgene_data)
-            self.cell_lines = cell_lines(depmap_record, cancerrxgene_record)
-
-            bulk_rna_annotation = namedtuple(
-                "bulk_rna_annotation",
-                "n_cell_line cell_line n_gene gene reference_id reference_id_example default_parameter",
-            )
-            bulk_rna_expression = namedtuple("bulk_rna_expression", ["broad", "sanger"])
-
-            broad_data = {
-                "n_cell_line": len(self.bulk_rna_broad.index),
-                "n_gene": len(self.bulk_rna_broad.columns),
-                "cell_line": self.bulk_rna_broad.index.values,
-                "gene": self.bulk_rna_broad.columns.values,
-                "reference_id": "DepMap_ID",
-                "reference_id_example": "DepMap_ID: ACH-001113",
-                "default_parameter": {
-                    "query_id": "DepMap_ID",
-                    "cell_line_source": "broad",
-                },
-            }
-            broad_record = bulk_rna_annotation(**broad_data)
-
-            sanger_data = {
-                "n_cell_line": len(self.bulk_rna_sanger.index),
-                "n_gene": len(self.bulk_rna_sanger.columns),
-                "cell_line": self.bulk_rna_sanger.index.values,
-                "gene": self.bulk_rna_sanger.columns.values,
-                "reference_id": "model_name",
-                "reference_id_example": "model_name: MEC-1",
-                "default_parameter": {
-                    "query_id": "cell_line_name",
-                    "cell_line_source": "sanger",
-                },
-            }
-            sanger_record = bulk_rna_annotation(**sanger_data)
-            self.bulk_rna = bulk_rna_expression(broad_record, sanger_record)
-
-            proteomics = namedtuple(
-                "proteomics",
-                "n_cell_line cell_line n_protein protein metadata reference_id reference_id_example default_parameter",
-            )
-            proteomics_data = {
-                "n_cell_line": len(self.proteomics_data["model_name"].unique()),
-                "n_protein": len(self.proteomics_data.uniprot_id.unique()),
-                "cell_line": self.proteomics_data["model_name"].unique(),
-                "protein": self.proteomics_data.uniprot_id.unique(),
-                "metadata": self.proteomics_data.columns.values,
-                "reference_id": ["model_id", "model_name"],
-                "reference_id_example": "model_id: SIDM00483 | model_name: SK-GT-4",
-                "default_parameter": {
-                    "query_id": "cell_line_name",
-                    "reference_id": "model_name",
-                    "bulk_rna_information": "read_count",
-                    "protein_information": "protein_intensity",
-                    "protein_id": "uniprot_id",
-                },
-            }
-            self.proteomics = proteomics(**proteomics_data)
-
-            drug_response_annotation = namedtuple(
-                "drug_response_annotation",
-                "n_cell_line cell_line n_drug drug_name metadata reference_id reference_id_example default_parameter",
-            )
-            drug_response = namedtuple("drug_response", ["gdsc1", "gdsc2"])
-
-            gdsc1_data = {
-                "n_cell_line": len(self.drug_response_gdsc1["cell_line_name"].unique()),
-                "n_drug": len(self.drug_response_gdsc1.drug_name.unique()),
-                "cell_line": self.drug_response_gdsc1.cell_line_name.unique(),
-                "drug_name": self.drug_response_gdsc1.drug_name.unique(),
-                "metadata": self.drug_response_gdsc1.columns.values,
-                "reference_id": ["cell_line_name", "sanger_model_id", "cosmic_id"],
-                "reference_id_example": "cell_line_name: ES5 | sanger_model_id: SIDM00263 | cosmic_id: 684057",
-                "default_parameter": {
-                    "gdsc_dataset": "1",
-                    "query_id": "cell_line_name",
-                    "reference_id": "cell_line_name",
-                    "query_perturbation": "perturbation",
-                    "reference_perturbation": "drug_name",
-                },
-            }
-            gdsc1_dict = drug_response_annotation(**gdsc1_data)
-
-            gdsc2_data = {
-                "n_cell_line": len(self.drug_response_gdsc2["cell_line_name"].unique()),
-                "n_drug": len(self.drug_response_gdsc2.drug_name.unique()),
-                "cell_line": self.drug_response_gdsc2.cell_line_name.unique(),
-                "drug_name": self.drug_response_gdsc2.drug_name.unique(),
-                "metadata": self.drug_response_gdsc2.columns.values,
-                "reference_id": ["cell_line_name", "sanger_model_id", "cosmic_id"],
-                "reference_id_example": "cell_line_name: PFSK-1 | sanger_model_id: SIDM01132 | cosmic_id: 683667",
-                "default_parameter": {
-                    "gdsc_dataset": "1",
-                    "query_id": "cell_line_name",
-                    "reference_id": "cell_line_name",
-                    "query_perturbation": "perturbation",
-                    "reference_perturbation": "drug_name",
-                },
-            }
-            gdsc2_dict = drug_response_annotation(**gdsc2_data)
-
-            self.drug_response = drug_response(gdsc1_dict, gdsc2_dict)
+        if type not in self._transfer_attributes:
+            raise NotImplementedError
+        self._loaders: dict[str, Callable[[], pd.DataFrame]] = {}
+        for attribute, metadata in zip(self._transfer_attributes[type], transfer_metadata or [], strict=True):
+            if callable(metadata):
+                self._loaders[attribute] = metadata
+            else:
+                setattr(self, attribute, metadata)
 
-        elif type == "moa":
-            self.moa_meta = transfer_metadata[0]
+        if type == "moa":
             moa_annotation = namedtuple(
                 "moa_annotation",
                 "n_pert n_moa query_id query_id_example target_example default_parameter",
@@ -228,10 +98,6 @@ class LookUp:
             self.compound = compound_annotation(**compound_data)
 
         elif type == "drug":
-            self.chembl = transfer_metadata[0]
-            self.dgidb = transfer_metadata[1]
-            self.pharmgkb = transfer_metadata[2]
-
             drug_annotation = namedtuple(
                 "drug_annotation",
                 "n_compound compound_example n_target target_example n_disease disease_example",
@@ -272,8 +138,186 @@ class LookUp:
             pharmgkb_record = drug_annotation(**pharmgkb_data)
             self.drugs = drugs(chembl_record, dgidb_record, pharmgkb_record)
 
-        else:
-            raise NotImplementedError
+    # Summary records and the DataFrames they are built from are only materialized
+    # on first access, so a LookUp constructed with lazy loaders stays cheap.
+    _summary_records = {
+        "cell_lines": "_build_cell_lines_record",
+        "bulk_rna": "_build_bulk_rna_record",
+        "proteomics": "_build_proteomics_record",
+        "drug_response": "_build_drug_response_record",
+    }
+
+    def __getattr__(self, name):
+        loaders = self.__dict__.get("_loaders", {})
+        if name in loaders:
+            # Drop the loader only after it succeeds so a transient download
+            # failure can be retried on the next access.
+            metadata = loaders[name]()
+            del loaders[name]
+            setattr(self, name, metadata)
+            return metadata
+        if self.__dict__.get("type") == "cell_line" and name in self._summary_records:
+            getattr(self, self._summary_records[name])()
+            return self.__dict__[name]
+        raise AttributeError(f"'LookUp' object has no attribute {name!r}")
+
+    def _build_cell_lines_record(self) -> None:
+        cell_line_annotation = namedtuple(
+            "cell_line_annotation",
+            "n_cell_line cell_line n_metadata metadata reference_id reference_id_example default_parameter",
+        )
+        cell_lines = namedtuple("cell_lines", ["depmap", "cancerrxgene"])
+
+        depmap_data = {
+            "n_cell_line": len(self.cell_line_meta.index),
+            "n_metadata": len(self.cell_line_meta.columns),
+            "cell_line": self.cell_line_meta.ModelID.values,
+            "metadata": self.cell_line_meta.columns.values,
+            "reference_id": [
+                "ModelID",
+                "CellLineName",
+                "StrippedCellLineName",
+                "CCLE_Name",
+            ],
+            "reference_id_example": "ModelID: ACH-000001 | CellLineName: NIH:OVCAR-3 | StrippedCellLineName: NIHOVCAR3 | CCLEName: NIHOVCAR3_OVARY",
+            "default_parameter": {
+                "cell_line_source": "DepMap",
+                "query_id": "DepMap_ID",
+                "reference_id": "ModelID",
+                "fetch": "None",
+            },
+        }
+        depmap_record = cell_line_annotation(**depmap_data)
+
+        cancerrxgene_data = {
+            "n_cell_line": len(self.cl_cancer_project_meta.index),
+            "n_metadata": len(self.cl_cancer_project_meta.columns),
+            "cell_line": self.cl_cancer_project_meta.stripped_cell_line_name.values,
+            "metadata": self.cl_cancer_project_meta.columns.values,
+            "reference_id": [
+                "cell_line_name",
+                "stripped_cell_line_name",
+                "Model ID",
+                "COSMIC ID",
+            ],
+            "reference_id_example": "cell_line_name: SNU-283 | stripped_cell_line_name: SNU283 | Model ID: SIDM00215 | COSMIC ID: 1659929",
+            "default_parameter": {
+                "query_id": "stripped_cell_line_name",
+                "reference_id": "stripped_cell_line_name",
+                "fetch": "None",
+            },
+        }
+        cancerrxgene_record = cell_line_annotation(**cancerrxgene_data)
+        self.cell_lines = cell_lines(depmap_record, cancerrxgene_record)
+
+    def _build_bulk_rna_record(self) -> None:
+        bulk_rna_annotation = namedtuple(
+            "bulk_rna_annotation",
+            "n_cell_line cell_line n_gene gene reference_id reference_id_example default_parameter",
+        )
+        bulk_rna_expression = namedtuple("bulk_rna_expression", ["broad", "sanger"])
+
+        broad_data = {
+            "n_cell_line": len(self.bulk_rna_broad.index),
+            "n_gene": len(self.bulk_rna_broad.columns),
+            "cell_line": self.bulk_rna_broad.index.values,
+            "gene": self.bulk_rna_broad.columns.values,
+            "reference_id": "DepMap_ID",
+            "reference_id_example": "DepMap_ID: ACH-001113",
+            "default_parameter": {
+                "query_id": "DepMap_ID",
+                "cell_line_source": "broad",
+            },
+        }
+        broad_record = bulk_rna_annotation(**broad_data)
+
+        sanger_data = {
+            "n_cell_line": len(self.bulk_rna_sanger.index),
+            "n_gene": len(self.bulk_rna_sanger.columns),
+            "cell_line": self.bulk_rna_sanger.index.values,
+            "gene": self.bulk_rna_sanger.columns.values,
+            "reference_id": "model_name",
+            "reference_id_example": "model_name: MEC-1",
+            "default_parameter": {
+                "query_id": "cell_line_name",
+                "cell_line_source": "sanger",
+            },
+        }
+        sanger_record = bulk_rna_annotation(**sanger_data)
+        self.bulk_rna = bulk_rna_expression(broad_record, sanger_record)
+
+    def _build_proteomics_record(self) -> None:
+        proteomics = namedtuple(
+            "proteomics",
+            "n_cell_line cell_line n_protein protein metadata reference_id reference_id_example default_parameter",
+        )
+        proteomics_data = {
+            "n_cell_line": len(self.proteomics_data["model_name"].unique()),
+            "n_protein": len(self.proteomics_data.uniprot_id.unique()),
+            "cell_line": self.proteomics_data["model_name"].unique(),
+            "protein": self.proteomics_data.uniprot_id.unique(),
+            "metadata": self.proteomics_data.columns.values,
+            "reference_id": ["model_id", "model_name"],
+            "reference_id_example": "model_id: SIDM00483 | model_name: SK-GT-4",
+            "default_parameter": {
+                "query_id": "cell_line_name",
+                "reference_id": "model_name",
+                "bulk_rna_information": "read_count",
+                "protein_information": "protein_intensity",
+                "protein_id": "uniprot_id",
+            },
+        }
+        self.proteomics = proteomics(**proteomics_data)
+
+    def _build_drug_response_record(self) -> None:
+        drug_response_annotation = namedtuple(
+            "drug_response_annotation",
+            "n_cell_line cell_line n_drug drug_name metadata reference_id reference_id_example default_parameter",
+        )
+        drug_response = namedtuple("drug_response", ["gdsc1", "gdsc2"])
+
+        gdsc1_data = {
+            "n_cell_line": len(self.drug_response_gdsc1["cell_line_name"].unique()),
+            "n_drug": len(self.drug_response_gdsc1.drug_name.unique()),
+            "cell_line": self.drug_response_gdsc1.cell_line_name.unique(),
+            "drug_name": self.drug_response_gdsc1.drug_name.unique(),
+            "metadata": self.drug_response_gdsc1.columns.values,
+            "reference_id": ["cell_line_name", "sanger_model_id", "cosmic_id"],
+            "reference_id_example": "cell_line_name: ES5 | sanger_model_id: SIDM00263 | cosmic_id: 684057",
+            "default_parameter": {
+                "gdsc_dataset": "1",
+                "query_id": "cell_line_name",
+                "reference_id": "cell_line_name",
+                "query_perturbation": "perturbation",
+                "reference_perturbation": "drug_name",
+            },
+        }
+        gdsc1_dict = drug_response_annotation(**gdsc1_data)
+
+        gdsc2_data = {
+            "n_cell_line": len(self.drug_response_gdsc2["cell_line_name"].unique()),
+            "n_drug": len(self.drug_response_gdsc2.drug_name.unique()),
+            "cell_line": self.drug_response_gdsc2.cell_line_name.unique(),
+            "drug_name": self.drug_response_gdsc2.drug_name.unique(),
+            "metadata": self.drug_response_gdsc2.columns.values,
+            "reference_id": ["cell_line_name", "sanger_model_id", "cosmic_id"],
+            "reference_id_example": "cell_line_name: PFSK-1 | sanger_model_id: SIDM01132 | cosmic_id: 683667",
+            "default_parameter": {
+                "gdsc_dataset": "1",
+                "query_id": "cell_line_name",
+                "reference_id": "cell_line_name",
+                "query_perturbation": "perturbation",
+                "reference_perturbation": "drug_name",
+            },
+        }
+        gdsc2_dict = drug_response_annotation(**gdsc2_data)
+
+        self.drug_response = drug_response(gdsc1_dict, gdsc2_dict)
+
+    def _check_type(self, expected: str, metadata_name: str) -> None:
+        """Raise if this LookUp object was not built for the expected metadata type."""
+        if self.type != expected:
+            raise ValueError(f"This is not a LookUp object specific for {metadata_name}!")
 
     def available_cell_lines(
         self,
@@ -290,8 +334,7 @@ class LookUp:
             query_id_list: Unique cell line identifiers to test the number of matched ids present in the
                 metadata. If set to None, the query of metadata identifiers will be disabled.
         """
-        if self.type != "cell_line":
-            raise ValueError("This is not a LookUp object specifically for CellLineMetaData!")
+        self._check_type("cell_line", "CellLineMetaData")
 
         if query_id_list is not None:
             identifier_num_all = len(query_id_list)
@@ -300,7 +343,9 @@ class LookUp:
                     raise ValueError(
                         f"The specified `reference_id` {reference_id} is not available in the DepMap cell line annotation data. "
                     )
-                not_matched_identifiers = list(set(query_id_list) - set(self.cell_line_meta[reference_id]))
+                not_matched_identifiers = np.setdiff1d(
+                    query_id_list, self.cell_line_meta[reference_id].dropna().to_numpy()
+                ).tolist()
             else:
                 if reference_id == "ModelID":
                     reference_id = "stripped_cell_line_name"
@@ -309,10 +354,14 @@ class LookUp:
                         f"The specified `reference_id` {reference_id} is not available "
                         f"in the cell line annotation from the project Genomics of Drug Sensitivity in Cancer. "
                     )
-                not_matched_identifiers = list(set(query_id_list) - set(self.cl_cancer_project_meta[reference_id]))
+                not_matched_identifiers = np.setdiff1d(
+                    query_id_list, self.cl_cancer_project_meta[reference_id].dropna().to_numpy()
+                ).tolist()
 
-            logger.info(f"{len(not_matched_identifiers)} cell lines are not found in the metadata.")
-            logger.info(f"{identifier_num_all - len(not_matched_identifiers)} cell lines are found! ")
+            logger.info(
+                f"{len(not_matched_identifiers)} cell lines are not found in the metadata.\n"
+                f"{identifier_num_all - len(not_matched_identifiers)} cell lines are found! "
+            )
 
     def available_bulk_rna(
         self,
@@ -326,8 +375,7 @@ class LookUp:
             query_id_list: Unique cell line identifiers to test the number of matched ids present in the
                 metadata. If set to None, the query of metadata identifiers will be disabled.
         """
-        if self.type != "cell_line":
-            raise ValueError("This is not a LookUp object specific for CellLineMetaData!")
+        self._check_type("cell_line", "CellLineMetaData")
 
         if cell_line_source == "broad":
             bulk_rna = self.bulk_rna_broad
@@ -336,10 +384,12 @@ class LookUp:
 
         if query_id_list is not None:
             identifier_num_all = len(query_id_list)
-            not_matched_identifiers = list(set(query_id_list) - set(bulk_rna.index))
+            not_matched_identifiers = np.setdiff1d(query_id_list, bulk_rna.index.dropna().to_numpy()).tolist()
 
-            logger.info(f"{len(not_matched_identifiers)} cell lines are not found in the metadata.")
-            logger.info(f"{identifier_num_all - len(not_matched_identifiers)} cell lines are found! ")
+            logger.info(
+                f"{len(not_matched_identifiers)} cell lines are not found in the metadata.\n"
+                f"{identifier_num_all - len(not_matched_identifiers)} cell lines are found! "
+            )
 
     def available_protein_expression(
         self,
@@ -353,8 +403,7 @@ class LookUp:
             query_id_list: Unique cell line identifiers to test the number of matched ids present in the
                 metadata. If set to None, the query of metadata identifiers will be disabled.
         """
-        if self.type != "cell_line":
-            raise ValueError("This is not a LookUp object specific for CellLineMetaData!")
+        self._check_type("cell_line", "CellLineMetaData")
 
         if query_id_list is not None:
             identifier_num_all = len(query_id_list)
@@ -363,9 +412,13 @@ class LookUp:
                 raise ValueError(
                     f"The specified `reference_id` {reference_id} is not available in the proteomics data. "
                 )
-            not_matched_identifiers = list(set(query_id_list) - set(self.proteomics_data[reference_id]))
-            logger.info(f"{len(not_matched_identifiers)} cell lines are not found in the metadata.")
-            logger.info(f"{identifier_num_all - len(not_matched_identifiers)} cell lines are found! ")
+            not_matched_identifiers = np.setdiff1d(
+                query_id_list, self.proteomics_data[reference_id].dropna().to_numpy()
+            ).tolist()
+            logger.info(
+                f"{len(not_matched_identifiers)} cell lines are not found in the metadata.\n"
+                f"{identifier_num_all - len(not_matched_identifiers)} cell lines are found! "
+            )
 
     def available_drug_response(
         self,
@@ -389,8 +442,7 @@ class LookUp:
             query_perturbation_list: Unique perturbation types to test the number of matched ones present in the metadata.
                                      If set to None, the query of perturbation types will be disabled.
         """
-        if self.type != "cell_line":
-            raise ValueError("This is not a LookUp object specific for CellLineMetaData!")
+        self._check_type("cell_line", "CellLineMetaData")
         if gdsc_dataset == 1:
             gdsc_data = self.drug_response_gdsc1
         else:
@@ -402,9 +454,11 @@ class LookUp:
                     f"The specified `reference_id` {reference_id} is not available in the GDSC drug response data. "
                 )
             identifier_num_all = len(query_id_list)
-            not_matched_identifiers = list(set(query_id_list) - set(gdsc_data[reference_id]))
-            logger.info(f"{len(not_matched_identifiers)} cell lines are not found in the metadata.")
-            logger.info(f"{identifier_num_all - len(not_matched_identifiers)} cell lines are found! ")
+            not_matched_identifiers = np.setdiff1d(query_id_list, gdsc_data[reference_id].dropna().to_numpy()).tolist()
+            logger.info(
+                f"{len(not_matched_identifiers)} cell lines are not found in the metadata.\n"
+                f"{identifier_num_all - len(not_matched_identifiers)} cell lines are found! "
+            )
 
         if query_perturbation_list is not None:
             if reference_perturbation not in gdsc_data.columns:
@@ -412,9 +466,13 @@ class LookUp:
                     f"The specified `reference_perturbation` {reference_perturbation} is not available in the GDSC drug response data. "
                 )
             identifier_num_all = len(query_perturbation_list)
-            not_matched_identifiers = list(set(query_perturbation_list) - set(gdsc_data[reference_perturbation]))
-            logger.info(f"{len(not_matched_identifiers)} perturbation types are not found in the metadata.")
-            logger.info(f"{identifier_num_all - len(not_matched_identifiers)} perturbation types are found! ")
+            not_matched_identifiers = np.setdiff1d(
+                query_perturbation_list, gdsc_data[reference_perturbation].dropna().to_numpy()
+            ).tolist()
+            logger.info(
+                f"{len(not_matched_identifiers)} perturbation types are not found in the metadata.\n"
+                f"{identifier_num_all - len(not_matched_identifiers)} perturbation types are found! "
+            )
 
     def available_genes_annotation(
         self,
@@ -427,18 +485,16 @@ class LookUp:
             reference_id: The type of gene identifier in the meta data, gene_id, ensembl_gene_id, hgnc_id, hgnc_symbol.
             query_id_list: Unique gene identifiers to test the number of matched ids present in the metadata.
         """
-        if self.type != "cell_line":
-            raise ValueError("This is not a LookUp object specific for CellLineMetaData!")
+        self._check_type("cell_line", "CellLineMetaData")
 
-        logger.info("To summarize: in the DepMap_Sanger gene annotation file, you can find: ")
-        logger.info(f"{len(self.gene_annotation.index)} driver genes")
+        metadata_columns = "\n- ".join(self.gene_annotation.columns.values)
         logger.info(
-            f"{len(self.gene_annotation.columns)} meta data including: ",
-            *list(self.gene_annotation.columns.values),
-            sep="\n- ",
+            "To summarize: in the DepMap_Sanger gene annotation file, you can find: \n"
+            f"{len(self.gene_annotation.index)} driver genes\n"
+            f"{len(self.gene_annotation.columns)} meta data including: \n- {metadata_columns}\n"
+            "Overview of gene annotation: \n"
+            f"{self.gene_annotation.head().to_string()}"
         )
-        logger.info("Overview of gene annotation: ")
-        logger.info(self.gene_annotation.head().to_string())
         """
         #not implemented yet
         print("Default parameters to annotate gene annotation: ")
@@ -467,20 +523,23 @@ class LookUp:
                          If set to None, the comparison of molecular targets in the query of metadata perturbagens will be disabled.
         """
         if query_id_list is not None:
-            if self.type != "moa":
-                raise ValueError("This is not a LookUp object specific for MoaMetaData!")
+            self._check_type("moa", "MoaMetaData")
             identifier_num_all = len(query_id_list)
-            not_matched_identifiers = list(set(query_id_list) - set(self.moa_meta.pert_iname))
-            logger.info(f"{len(not_matched_identifiers)} perturbagens are not found in the metadata.")
-            logger.info(f"{identifier_num_all - len(not_matched_identifiers)} perturbagens are found! ")
+            not_matched_identifiers = np.setdiff1d(query_id_list, self.moa_meta.pert_iname.dropna().to_numpy()).tolist()
+            logger.info(
+                f"{len(not_matched_identifiers)} perturbagens are not found in the metadata.\n"
+                f"{identifier_num_all - len(not_matched_identifiers)} perturbagens are found! "
+            )
 
         if target_list is not None:
             targets = self.moa_meta.target.astype(str).apply(lambda x: x.split("|"))
             all_targets = [t for tl in targets for t in tl]
             identifier_num_all = len(target_list)
-            not_matched_identifiers = list(set(target_list) - set(all_targets))
-            logger.info(f"{len(not_matched_identifiers)} molecular targets are not found in the metadata.")
-            logger.info(f"{identifier_num_all - len(not_matched_identifiers)} molecular targets are found! ")
+            not_matched_identifiers = np.setdiff1d(target_list, all_targets).tolist()
+            logger.info(
+                f"{len(not_matched_identifiers)} molecular targets are not found in the metadata.\n"
+                f"{identifier_num_all - len(not_matched_identifiers)} molecular targets are found! "
+            )
 
     def available_compounds(
         self,
@@ -494,8 +553,7 @@ class LookUp:
                         If set to None, query of compound identifiers will be disabled.
             query_id_type: The type of compound identifiers, name or cid.
         """
-        if self.type != "compound":
-            raise ValueError("This is not a LookUp object specific for CompoundData!")
+        self._check_type("compound", "CompoundData")
         if query_id_list is not None:
             identifier_num_all = len(query_id_list)
             not_matched_identifiers = []
@@ -511,8 +569,10 @@ class LookUp:
                     except pcp.BadRequestError:
                         not_matched_identifiers.append(compound)
 
-            logger.info(f"{len(not_matched_identifiers)} compounds are not found in the metadata.")
-            logger.info(f"{identifier_num_all - len(not_matched_identifiers)} compounds are found! ")
+            logger.info(
+                f"{len(not_matched_identifiers)} compounds are not found in the metadata.\n"
+                f"{identifier_num_all - len(not_matched_identifiers)} compounds are found! "
+            )
 
     def available_drug_annotation(
         self,
@@ -528,8 +588,7 @@ class LookUp:
                         If set to None, query of compound identifiers will be disabled.
             query_id_type: The type of identifiers, target, compound and disease(pharmgkb only).
         """
-        if self.type != "drug":
-            raise ValueError("This is not a LookUp object specific for DrugMetaData!")
+        self._check_type("drug", "DrugMetaData")
         if query_id_list is not None:
             identifier_num_all = len(query_id_list)
             not_matched_identifiers = []
@@ -538,9 +597,11 @@ class LookUp:
                 if query_id_type == "target":
                     chembl_targets = {t for target in self.chembl.targets.tolist() for t in target}
                     # flatten the target column and remove duplicates
-                    not_matched_identifiers = list(set(query_id_list) - chembl_targets)
+                    not_matched_identifiers = np.setdiff1d(query_id_list, list(chembl_targets)).tolist()
                 elif query_id_type == "compound":
-                    not_matched_identifiers = list(set(query_id_list) - self.chembl["compounds"])
+                    not_matched_identifiers = np.setdiff1d(
+                        query_id_list, self.chembl["compounds"].dropna().to_numpy()
+                    ).tolist()
                 else:
                     raise ValueError(
                         "Gene-disease association is not available in chembl dataset, please try with pharmgkb."
@@ -548,22 +609,34 @@ class LookUp:
 
             elif drug_annotation_source == "dgidb":
                 if query_id_type == "target":
-                    not_matched_identifiers = list(set(query_id_list) - set(self.dgidb["gene_claim_name"]))
+                    not_matched_identifiers = np.setdiff1d(
+                        query_id_list, self.dgidb["gene_claim_name"].dropna().to_numpy()
+                    ).tolist()
                 elif query_id_type == "compound":
-                    not_matched_identifiers = list(set(query_id_list) - set(self.dgidb["drug_claim_name"]))
+                    not_matched_identifiers = np.setdiff1d(
+                        query_id_list, self.dgidb["drug_claim_name"].dropna().to_numpy()
+                    ).tolist()
                 else:
                     raise ValueError(
                         "Gene-disease association is not available in dgidb dataset, please try with pharmgkb."
                     )
             else:
                 if query_id_type == "target":
-                    not_matched_identifiers = list(set(query_id_list) - set(self.pharmgkb["Gene"]))
+                    not_matched_identifiers = np.setdiff1d(
+                        query_id_list, self.pharmgkb["Gene"].dropna().to_numpy()
+                    ).tolist()
                 elif query_id_type == "compound":
                     compounds = self.pharmgkb[self.pharmgkb["Type"] == "Chemical"]
-                    not_matched_identifiers = list(set(query_id_list) - set(compounds["Compound|Disease"]))
+                    not_matched_identifiers = np.setdiff1d(
+                        query_id_list, compounds["Compound|Disease"].dropna().to_numpy()
+                    ).tolist()
                 else:
                     diseases = self.pharmgkb[self.pharmgkb["Type"] == "Disease"]
-                    not_matched_identifiers = list(set(query_id_list) - set(diseases["Compound|Disease"]))
+                    not_matched_identifiers = np.setdiff1d(
+                        query_id_list, diseases["Compound|Disease"].dropna().to_numpy()
+                    ).tolist()
 
-            logger.info(f"{len(not_matched_identifiers)} {query_id_type}s are not found in the metadata.")
-            logger.info(f"{identifier_num_all - len(not_matched_identifiers)} {query_id_type}s are found! ")
+            logger.info(
+                f"{len(not_matched_identifiers)} {query_id_type}s are not found in the metadata.\n"
+                f"{identifier_num_all - len(not_matched_identifiers)} {query_id_type}s are found! "
+            )
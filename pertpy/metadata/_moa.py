@@ -21,19 +21,43 @@ class Moa(MetaData):
 
     def __init__(self):
         self.clue = None
+        self._pert_iname_lower: pd.Series | None = None
+        self._pert_iname_lower_index: pd.Index | None = None
 
     def _download_clue(self) -> None:
         clue_path = Path(settings.cachedir) / "repurposing_drugs_20200324.txt"
+        feather_path = clue_path.with_suffix(".feather")
         if not Path(clue_path).exists():
             _download(
                 url="https://s3.amazonaws.com/data.clue.io/repurposing/downloads/repurposing_drugs_20200324.txt",
                 output_file_name="repurposing_drugs_20200324.txt",
                 output_path=settings.cachedir,
-                block_size=4096,
                 is_zip=False,
             )
-        self.clue = pd.read_csv(clue_path, sep="	", skiprows=9)
-        self.clue = self.clue[["pert_iname", "moa", "target"]]
+        # Parsing the TSV dominates construction time, so the three needed columns are
+        # cached in binary form next to it and reused as long as the TSV is unchanged.
+        if feather_path.exists() and feather_path.stat().st_mtime >= clue_path.stat().st_mtime:
+            self.clue = pd.read_feather(feather_path)
+        else:
+            self.clue = pd.read_csv(
+                clue_path,
+                sep="	",
+                skiprows=9,
+                usecols=["pert_iname", "moa", "target"],
+                dtype="string",
+            )
+            self.clue.to_feather(feather_path)
+        # Cache the lowercased reference identifiers so that annotate() does not
+        # re-lower the full column on every call.
+        self._pert_iname_lower = self.clue["pert_iname"].str.lower()
+        self._pert_iname_lower_index = pd.Index(self._pert_iname_lower.dropna().unique())
+        # Reference table with a materialized normalized join column so that
+        # annotate() can merge on a named key instead of temporary Series keys.
+        # Deduplicated on the key so the left merge is guaranteed many-to-one and
+        # cannot blow up the row count if clue.io ever ships duplicate pert_inames.
+        self._clue_merge = self.clue.assign(_pert_iname_lower=self._pert_iname_lower).drop_duplicates(
+            "_pert_iname_lower"
+        )
 
     def annotate(
         self,
@@ -41,6 +65,7 @@ class Moa(MetaData):
         query_id: str = "perturbation",
         target: str | None = None,
         verbosity: int | str = 5,
+        categorical: bool = True,
         copy: bool = False,
     ) -> AnnData:
         """Annotate cells affected by perturbations by mechanism of action.
@@ -52,6 +77,8 @@ class Moa(MetaData):
             query_id: The column of `.obs` with the name of a perturbagen.
             target: The column of `.obs` with target information. If set to None, all MoAs are retrieved without comparing molecular targets.
             verbosity: The number of unmatched identifiers to print, can be either non-negative values or 'all'.
+            categorical: Determines whether the annotated metadata columns are converted to category dtype.
+                         The annotations repeat per perturbagen, so this saves considerable memory on large datasets.
             copy: Determines whether a copy of the `adata` is returned.
 
         Returns:
@@ -66,8 +93,11 @@ class Moa(MetaData):
         if self.clue is None:
             self._download_clue()
 
-        identifier_num_all = len(adata.obs[query_id].unique())
-        not_matched_identifiers = list(set(adata.obs[query_id].str.lower()) - set(self.clue["pert_iname"].str.lower()))
+        query_series = adata.obs[query_id]
+        unique_ids = pd.Index(query_series.dropna().unique())
+        identifier_num_all = len(unique_ids)
+        unique_ids_lower = unique_ids.str.lower()
+        not_matched_identifiers = list(unique_ids_lower.unique().difference(self._pert_iname_lower_index))
         self._warn_unmatch(
             total_identifiers=identifier_num_all,
             unmatched_identifiers=not_matched_identifiers,
@@ -77,25 +107,55 @@ class Moa(MetaData):
             verbosity=verbosity,
         )
 
+        # Lowering the unique identifiers is cheap; lowering the full column is an
+        # O(n_obs) string allocation that can be skipped when the data is already
+        # normalized, which the unique values tell us in one pass.
+        if (unique_ids == unique_ids_lower).all():
+            query_key = query_series
+        else:
+            query_key = query_series.str.lower()
+        # Encode both merge keys as categoricals over a shared dictionary so that
+        # pandas joins on the integer codes instead of hashing every string per row.
+        # unique_ids_lower can contain duplicates when spellings differ only by case,
+        # and categorical categories must be unique.
+        merge_key_cats = self._pert_iname_lower_index.union(unique_ids_lower.unique())
+        query_key = pd.Categorical(query_key, categories=merge_key_cats)
+        clue_merge = self._clue_merge.assign(
+            _pert_iname_lower=pd.Categorical(self._clue_merge["_pert_iname_lower"], categories=merge_key_cats)
+        )
         adata.obs = (
-            adata.obs.merge(
-                self.clue,
-                left_on=adata.obs[query_id].str.lower(),
-                right_on=self.clue["pert_iname"].str.lower(),
+            adata.obs.assign(_pert_iname_lower=query_key)
+            .merge(
+                clue_merge,
+                on="_pert_iname_lower",
                 how="left",
                 suffixes=("", "_fromMeta"),
+                validate="m:1",
             )
-            .set_index(adata.obs.index)
-            .drop("key_0", axis=1)
+            .drop(columns="_pert_iname_lower")
+            .set_axis(adata.obs.index)
         )
 
         # If target column is given, check whether it is one of the targets listed in the metadata
         # If inconsistent, treat this perturbagen as unmatched and overwrite the annotated metadata with NaN
         if target is not None:
             target_meta = "target" if target != "target" else "target_fromMeta"
-            adata.obs[target_meta] = adata.obs[target_meta].mask(
-                ~adata.obs.apply(lambda row: str(row[target]) in str(row[target_meta]), axis=1)
+            query_targets = adata.obs[target].astype(str).to_numpy()
+            # The annotated targets are pipe-delimited token lists repeated across all
+            # cells of a perturbagen, so tokenize each unique value once and test exact
+            # membership by hash instead of scanning the string per cell.
+            meta_codes, meta_uniques = pd.factorize(adata.obs[target_meta])
+            token_sets = [frozenset(str(meta).split("|")) for meta in meta_uniques]
+            no_targets: frozenset[str] = frozenset()
+            consistent = np.fromiter(
+                (
+                    q in (token_sets[code] if code >= 0 else no_targets)
+                    for q, code in zip(query_targets, meta_codes, strict=False)
+                ),
+                dtype=bool,
+                count=len(query_targets),
             )
+            adata.obs[target_meta] = adata.obs[target_meta].mask(~consistent)
             pertname_meta = "pert_iname" if query_id != "pert_iname" else "pert_iname_fromMeta"
             adata.obs.loc[adata.obs[target_meta].isna(), [pertname_meta, "moa"]] = np.nan
 
@@ -104,6 +164,11 @@ class Moa(MetaData):
         if query_id != "pert_iname":
             del adata.obs["pert_iname"]
 
+        if categorical:
+            for column in ("pert_iname", "moa", "target"):
+                if column in adata.obs:
+                    adata.obs[column] = adata.obs[column].astype("category")
+
         return adata
 
     def lookup(self) -> LookUp:
@@ -3,6 +3,16 @@ import pandas as pd
 from anndata import AnnData
 
 
+def _masked_corr(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation over the pairs where both values are finite.
+
+    Matches pandas' pairwise NaN exclusion; DE scores and adjusted p-values from
+    rank_genes_groups or user-supplied tables can contain NaN.
+    """
+    finite = np.isfinite(x) & np.isfinite(y)
+    return np.corrcoef(x[finite], y[finite])[0, 1]
+
+
 class DGEEVAL:
     def compare(
         self,
@@ -57,30 +67,40 @@ class DGEEVAL:
             vars = de_df1["variable"].sort_values()
 
         shared_top = min(shared_top, len(vars))
-        vars_ranks = np.arange(1, len(vars) + 1)
-        results = pd.DataFrame(index=vars)
+        # The per-analysis arrays are aligned by sorted variable name, so they are kept
+        # as plain numpy columns; building a DataFrame would only add block-manager and
+        # index-alignment overhead for the correlations below.
+        results: dict[str, np.ndarray] = {}
         top_names = []
 
         if de_key1 and de_key2:
             for i, k in enumerate([de_key1, de_key2]):
                 label = adata.uns[k]["names"].dtype.names[0]
                 srt_idx = np.argsort(adata.uns[k]["names"][label])
-                results[f"scores_{i}"] = adata.uns[k]["scores"][label][srt_idx]
-                results[f"pvals_adj_{i}"] = adata.uns[k]["pvals_adj"][label][srt_idx]
-                results[f"ranks_{i}"] = vars_ranks[srt_idx]
+                results[f"scores_{i}"] = np.take(adata.uns[k]["scores"][label], srt_idx)
+                results[f"pvals_adj_{i}"] = np.take(adata.uns[k]["pvals_adj"][label], srt_idx)
+                # Gathering 1-based positions through srt_idx is the identity srt_idx + 1,
+                # which saves one full pass over the permutation.
+                results[f"ranks_{i}"] = srt_idx + 1
                 top_names.append(adata.uns[k]["names"][label][:shared_top])
         else:
             for i, df in enumerate([de_df1, de_df2]):
                 srt_idx = np.argsort(df["variable"])
-                results[f"scores_{i}"] = df["log_fc"].values[srt_idx]
-                results[f"pvals_adj_{i}"] = df["adj_p_value"].values[srt_idx]
-                results[f"ranks_{i}"] = vars_ranks[srt_idx]
+                results[f"scores_{i}"] = np.take(df["log_fc"].values, srt_idx)
+                results[f"pvals_adj_{i}"] = np.take(df["adj_p_value"].values, srt_idx)
+                results[f"ranks_{i}"] = srt_idx + 1
                 top_names.append(df["variable"][:shared_top])
 
         metrics = {}
-        metrics["shared_top_genes"] = len(set(top_names[0]).intersection(top_names[1])) / shared_top
-        metrics["scores_corr"] = results["scores_0"].corr(results["scores_1"], method="pearson")
-        metrics["pvals_adj_corr"] = results["pvals_adj_0"].corr(results["pvals_adj_1"], method="pearson")
-        metrics["scores_ranks_corr"] = results["ranks_0"].corr(results["ranks_1"], method="spearman")
+        # Gene names are unique per analysis, so the overlap can be counted with
+        # numpy's sort-merge intersection instead of two Python hash sets.
+        metrics["shared_top_genes"] = (
+            np.intersect1d(np.asarray(top_names[0]), np.asarray(top_names[1]), assume_unique=True).size / shared_top
+        )
+        metrics["scores_corr"] = _masked_corr(results["scores_0"], results["scores_1"])
+        metrics["pvals_adj_corr"] = _masked_corr(results["pvals_adj_0"], results["pvals_adj_1"])
+        # The rank columns are tie-free permutations of 1..n, so Spearman's rho equals
+        # Pearson on the ranks and needs no re-ranking pass.
+        metrics["scores_ranks_corr"] = np.corrcoef(results["ranks_0"], results["ranks_1"])[0, 1]
 
         return metrics
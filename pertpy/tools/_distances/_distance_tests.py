@@ -65,16 +65,18 @@ class DistanceTest:
         self.obsm_key = obsm_key
         self.alpha = alpha
         self.correction = correction
-        self.cell_wise_metric = (
-            cell_wise_metric if cell_wise_metric else Distance(self.metric, obsm_key=self.obsm_key).cell_wise_metric
-        )
-
-        self.distance = Distance(
-            self.metric,
-            layer_key=self.layer_key,
-            obsm_key=self.obsm_key,
-            cell_wise_metric=self.cell_wise_metric,
-        )
+        # Build the Distance once; falling back to its own cell_wise_metric default
+        # avoids constructing a throwaway instance just to read that default.
+        if cell_wise_metric:
+            self.distance = Distance(
+                self.metric,
+                layer_key=self.layer_key,
+                obsm_key=self.obsm_key,
+                cell_wise_metric=cell_wise_metric,
+            )
+        else:
+            self.distance = Distance(self.metric, layer_key=self.layer_key, obsm_key=self.obsm_key)
+        self.cell_wise_metric = self.distance.cell_wise_metric
 
     def __call__(
         self,
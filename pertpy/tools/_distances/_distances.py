@@ -34,6 +34,114 @@ class MeanVar(NamedTuple):
     variance: float
 
 
+@numba.njit(cache=True, fastmath=True, parallel=True)
+def _column_mean(X: np.ndarray) -> np.ndarray:
+    n, d = X.shape
+    out = np.zeros(d)
+    for i in numba.prange(n):
+        out += X[i]
+    return out / n
+
+
+@numba.njit(cache=True, fastmath=True)
+def _fused_euclidean_ratio(pert_mean: np.ndarray, pred_mean: np.ndarray, ctrl_mean: np.ndarray) -> float:
+    d1 = 0.0
+    d2 = 0.0
+    for j in range(pred_mean.shape[0]):
+        a = pert_mean[j] - pred_mean[j]
+        b = ctrl_mean[j] - pred_mean[j]
+        d1 += a * a
+        d2 += b * b
+    return np.sqrt(d1) / np.sqrt(d2)
+
+
+@numba.njit(cache=True, fastmath=True)
+def _fused_mse_ratio(pert_mean: np.ndarray, pred_mean: np.ndarray, ctrl_mean: np.ndarray) -> float:
+    d1 = 0.0
+    d2 = 0.0
+    for j in range(pred_mean.shape[0]):
+        a = pert_mean[j] - pred_mean[j]
+        b = ctrl_mean[j] - pred_mean[j]
+        d1 += a * a
+        d2 += b * b
+    return d1 / d2
+
+
+@numba.njit(cache=True, fastmath=True)
+def _fused_mean_absolute_ratio(pert_mean: np.ndarray, pred_mean: np.ndarray, ctrl_mean: np.ndarray) -> float:
+    d1 = 0.0
+    d2 = 0.0
+    for j in range(pred_mean.shape[0]):
+        d1 += abs(pert_mean[j] - pred_mean[j])
+        d2 += abs(ctrl_mean[j] - pred_mean[j])
+    return d1 / d2
+
+
+@numba.njit(cache=True, fastmath=True)
+def _fused_cosine_ratio(pert_mean: np.ndarray, pred_mean: np.ndarray, ctrl_mean: np.ndarray) -> float:
+    dot1 = 0.0
+    dot2 = 0.0
+    sq_pred = 0.0
+    sq_pert = 0.0
+    sq_ctrl = 0.0
+    for j in range(pred_mean.shape[0]):
+        p = pred_mean[j]
+        dot1 += pert_mean[j] * p
+        dot2 += ctrl_mean[j] * p
+        sq_pred += p * p
+        sq_pert += pert_mean[j] * pert_mean[j]
+        sq_ctrl += ctrl_mean[j] * ctrl_mean[j]
+    norm_pred = np.sqrt(sq_pred)
+    d1 = 1.0 - dot1 / (np.sqrt(sq_pert) * norm_pred)
+    d2 = 1.0 - dot2 / (np.sqrt(sq_ctrl) * norm_pred)
+    return d1 / d2
+
+
+@numba.njit(cache=True, fastmath=True)
+def _fused_pearson_ratio(pert_mean: np.ndarray, pred_mean: np.ndarray, ctrl_mean: np.ndarray) -> float:
+    d = pred_mean.shape[0]
+    center_pred = 0.0
+    center_pert = 0.0
+    center_ctrl = 0.0
+    for j in range(d):
+        center_pred += pred_mean[j]
+        center_pert += pert_mean[j]
+        center_ctrl += ctrl_mean[j]
+    center_pred /= d
+    center_pert /= d
+    center_ctrl /= d
+    cov1 = 0.0
+    cov2 = 0.0
+    var_pred = 0.0
+    var_pert = 0.0
+    var_ctrl = 0.0
+    for j in range(d):
+        p = pred_mean[j] - center_pred
+        a = pert_mean[j] - center_pert
+        b = ctrl_mean[j] - center_ctrl
+        cov1 += a * p
+        cov2 += b * p
+        var_pred += p * p
+        var_pert += a * a
+        var_ctrl += b * b
+    d1 = 1.0 - cov1 / np.sqrt(var_pert * var_pred)
+    d2 = 1.0 - cov2 / np.sqrt(var_ctrl * var_pred)
+    return d1 / d2
+
+
+# Fused compare_distance scorers for the pseudobulk metrics whose score is a pure
+# reduction over the aggregated vectors. They aggregate `pred` once instead of twice
+# and compute both distances in a single cache-resident pass.
+_FUSED_RATIO_FCTS: dict[str, Callable[[np.ndarray, np.ndarray, np.ndarray], float]] = {
+    "euclidean": _fused_euclidean_ratio,
+    "root_mean_squared_error": _fused_euclidean_ratio,
+    "mse": _fused_mse_ratio,
+    "mean_absolute_error": _fused_mean_absolute_ratio,
+    "cosine_distance": _fused_cosine_ratio,
+    "pearson_distance": _fused_pearson_ratio,
+}
+
+
 class Distance:
     """Distance class, used to compute distances between groups of cells.
 
@@ -553,14 +661,35 @@ class Distance:
         if mode == "simple":
             pass  # nothing to be done
         elif mode == "scaled":
-            from sklearn.preprocessing import MinMaxScaler
-
-            scaler = MinMaxScaler().fit(np.vstack((pert, ctrl)) if fit_to_pert_and_ctrl else ctrl)
-            pred = scaler.transform(pred)
-            pert = scaler.transform(pert)
+            # Min-max scaling computed directly from column reductions: fitting a
+            # MinMaxScaler on np.vstack((pert, ctrl)) would allocate a stacked copy of
+            # both arrays just to take their min and max.
+            if fit_to_pert_and_ctrl:
+                data_min = np.minimum(pert.min(axis=0), ctrl.min(axis=0))
+                data_range = np.maximum(pert.max(axis=0), ctrl.max(axis=0)) - data_min
+            else:
+                data_min = ctrl.min(axis=0)
+                data_range = ctrl.max(axis=0) - data_min
+            # Constant features are mapped with scale 1, matching MinMaxScaler.
+            scale = np.ones_like(data_range, dtype=np.float64)
+            np.divide(1.0, data_range, out=scale, where=data_range != 0)
+            pred = (pred - data_min) * scale
+            pert = (pert - data_min) * scale
         else:
             raise ValueError(f"Unknown mode {mode}. Please choose simple or scaled.")
 
+        fused = _FUSED_RATIO_FCTS.get(self.metric)
+        if (
+            fused is not None
+            and not kwargs
+            and self.aggregation_func is np.mean
+            and not (issparse(pert) or issparse(pred) or issparse(ctrl))
+        ):
+            pert_mean = _column_mean(np.ascontiguousarray(pert, dtype=np.float64))
+            pred_mean = _column_mean(np.ascontiguousarray(pred, dtype=np.float64))
+            ctrl_mean = _column_mean(np.ascontiguousarray(ctrl, dtype=np.float64))
+            return float(fused(pert_mean, pred_mean, ctrl_mean))
+
         d1 = self.metric_fct(pert, pred, **kwargs)
         d2 = self.metric_fct(ctrl, pred, **kwargs)
         return d1 / d2
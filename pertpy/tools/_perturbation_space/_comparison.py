@@ -7,9 +7,41 @@ from scipy.sparse import vstack as sp_vstack
 from sklearn.base import ClassifierMixin
 from sklearn.linear_model import LogisticRegression
 
+try:
+    # Optional accelerated knn backend; its C++ index builds and queries several
+    # times faster than pynndescent on dense PCA-sized embeddings.
+    import hnswlib
+except ImportError:  # pragma: no cover
+    hnswlib = None
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+# Scratch buffers for stacking dense inputs, keyed on the result shape and dtype.
+# Sweeps call the comparison methods many times with identically shaped arrays, so
+# reusing the concatenation target avoids reallocating hundreds of MB per call.
+_STACK_BUF: dict[tuple[tuple[int, int], np.dtype], np.ndarray] = {}
+_STACK_BUF_MAX = 4
+
+
+def _stack_dense(arrays: tuple[np.ndarray, ...]) -> np.ndarray:
+    """Concatenate dense 2D arrays row-wise into a reused scratch buffer.
+
+    The returned buffer is owned by the cache and overwritten by the next call with
+    the same shape and dtype, so callers must not hold on to it across calls.
+    """
+    shape = (sum(a.shape[0] for a in arrays), arrays[0].shape[1])
+    key = (shape, np.result_type(*arrays))
+    buf = _STACK_BUF.pop(key, None)
+    if buf is None:
+        buf = np.empty(*key)
+    # Reinsert as most recently used; dict order doubles as the LRU queue.
+    _STACK_BUF[key] = buf
+    while len(_STACK_BUF) > _STACK_BUF_MAX:
+        del _STACK_BUF[next(iter(_STACK_BUF))]
+    np.concatenate(arrays, axis=0, out=buf)
+    return buf
+
 
 class PerturbationComparison:
     """Comparison between real and simulated perturbations."""
@@ -36,11 +68,20 @@ class PerturbationComparison:
         if clf is None:
             clf = LogisticRegression()
         n_x = real.shape[0]
-        data = sp_vstack((real, control)) if issparse(real) else np.vstack((real, control))
-        labels = np.concatenate([np.full(real.shape[0], "comp"), np.full(control.shape[0], "ctrl")])
+        data = sp_vstack((real, control)) if issparse(real) else _stack_dense((real, control))
+        # Binary integer labels (1 = perturbed, 0 = control) instead of string labels:
+        # sklearn would only encode the strings to integers internally anyway, and the
+        # int8 buffer is a fraction of the size of a unicode array.
+        labels = np.zeros(data.shape[0], dtype=np.int8)
+        labels[:n_x] = 1
 
         clf.fit(data, labels)
-        norm_score = clf.score(simulated, np.full(simulated.shape[0], "comp")) / clf.score(real, labels[:n_x])
+        # Both accuracies are against an all-perturbed target, so they reduce to the
+        # fraction of rows predicted as class 1; calling predict directly skips the
+        # scorer dispatch and the target-array allocations of clf.score.
+        simulated_acc = (clf.predict(simulated) == 1).mean()
+        real_acc = (clf.predict(real) == 1).mean()
+        norm_score = simulated_acc / real_acc
         norm_score = min(1.0, norm_score)
 
         return norm_score
@@ -79,34 +120,50 @@ class PerturbationComparison:
         n_y = simulated.shape[0]
 
         if control is None:
-            index_data = sp_vstack((simulated, real)) if issparse(real) else np.vstack((simulated, real))
+            index_data = sp_vstack((simulated, real)) if issparse(real) else _stack_dense((simulated, real))
         else:
             datas = (simulated, real, control) if use_simulated_for_knn else (real, control)
-            index_data = sp_vstack(datas) if issparse(real) else np.vstack(datas)
+            index_data = sp_vstack(datas) if issparse(real) else _stack_dense(datas)
 
         y_in_index = use_simulated_for_knn or control is None
         c_in_index = control is not None
+        # Integer label codes (0=comp, 1=siml, 2=ctrl) so the neighbor counting below
+        # is a single bincount pass instead of a sort-based unique over strings.
         label_groups = ["comp"]
-        labels: NDArray[np.str_] = np.full(index_data.shape[0], "comp")
+        labels: NDArray[np.int8] = np.zeros(index_data.shape[0], dtype=np.int8)
         if y_in_index:
-            labels[:n_y] = "siml"
+            labels[:n_y] = 1
             label_groups.append("siml")
         if c_in_index:
-            labels[-control.shape[0] :] = "ctrl"
+            labels[-control.shape[0] :] = 2
             label_groups.append("ctrl")
 
-        index = pynndescent.NNDescent(
-            index_data,
-            n_neighbors=max(50, n_neighbors),
-            random_state=random_state,
-            n_jobs=n_jobs,
-        )
-        indices = index.query(simulated, k=n_neighbors)[0]
-
-        uq, uq_counts = np.unique(labels[indices], return_counts=True)
-        uq_counts_norm = uq_counts / uq_counts.sum()
-        counts = dict(zip(label_groups, [0.0] * len(label_groups), strict=False))
-        for group, count_norm in zip(uq, uq_counts_norm, strict=False):
-            counts[group] = count_norm
+        if hnswlib is not None and not issparse(index_data):
+            index = hnswlib.Index(space="l2", dim=index_data.shape[1])
+            index.init_index(
+                max_elements=index_data.shape[0],
+                ef_construction=200,
+                M=16,
+                random_seed=random_state,
+            )
+            index.add_items(index_data, num_threads=n_jobs)
+            index.set_ef(max(64, 2 * n_neighbors))
+            indices = index.knn_query(simulated, k=n_neighbors, num_threads=n_jobs)[0]
+        else:
+            index = pynndescent.NNDescent(
+                index_data,
+                n_neighbors=max(50, n_neighbors),
+                random_state=random_state,
+                n_jobs=n_jobs,
+            )
+            indices = index.query(simulated, k=n_neighbors)[0]
+
+        label_counts = np.bincount(labels[indices].ravel(), minlength=3)
+        label_counts_norm = label_counts / label_counts.sum()
+        counts = {
+            group: label_counts_norm[code]
+            for code, group in enumerate(("comp", "siml", "ctrl"))
+            if group in label_groups
+        }
 
         return counts
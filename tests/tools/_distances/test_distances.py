@@ -33,8 +33,14 @@ all_distances = (
 )  # + onesided_only
 
 
+@fixture(scope="session")
+def distance_example_data():
+    # Loaded once per session; every test works on its own subsampled copy below.
+    return pt.dt.distance_example()
+
+
 @fixture
-def adata(request):
+def adata(request, distance_example_data):
     low_subsample_distances = [
         "sym_kldiv",
         "t_test",
@@ -48,12 +54,14 @@ def adata(request):
 
     distance = request.node.callspec.params["distance"]
 
-    adata = pt.dt.distance_example()
+    adata = distance_example_data
     if distance not in no_subsample_distances:
         if distance in low_subsample_distances:
             adata = sc.pp.subsample(adata, 0.1, copy=True)
         else:
             adata = sc.pp.subsample(adata, 0.001, copy=True)
+    else:
+        adata = adata.copy()
 
     adata.layers["lognorm"] = adata.X.copy()
     adata.layers["counts"] = np.round(adata.X.toarray()).astype(int)